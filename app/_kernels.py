@@ -0,0 +1,71 @@
+"""
+Optional Numba-compiled kernel for batch scoring.
+
+When numba is installed, score_batch_kernel compiles to native code and
+loops rows in parallel; ScorecardModel.score_batch falls back to the
+pure-NumPy path when it is not. Import this module and check
+NUMBA_AVAILABLE rather than importing numba directly.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, parallel=True)
+    def score_batch_kernel(
+        cat_idx,          # (N, F) intp; bin column per categorical feature, -1 for numeric
+        num_vals,         # (N, K) float64; raw values for the K numeric features
+        num_feature_pos,  # (K,) intp; feature position of each numeric feature
+        edges_flat,       # float64; all numeric edge arrays concatenated
+        edges_offsets,    # (K+1,) intp; CSR offsets into edges_flat
+        points_flat,      # int32; all features' bin points concatenated
+        points_offsets,   # (F+1,) intp; CSR offsets into points_flat
+        base,             # float64 base points
+    ):
+        """Return per-row total scores (base included); NaN marks rows
+        whose numeric value fell below the first bin edge."""
+        n, n_features = cat_idx.shape
+        n_numeric = num_vals.shape[1]
+        totals = np.empty(n, dtype=np.float64)
+
+        for i in prange(n):
+            t = 0.0
+            for j in range(n_features):
+                col = cat_idx[i, j]
+                if col >= 0:
+                    t += points_flat[points_offsets[j] + col]
+            for q in range(n_numeric):
+                start = edges_offsets[q]
+                end = edges_offsets[q + 1]
+                value = num_vals[i, q]
+                # Rightmost edge <= value (bisect_right - 1); the final
+                # edge is +inf so finite values never overrun.
+                lo = start
+                hi = end
+                while lo < hi:
+                    mid = (lo + hi) >> 1
+                    if edges_flat[mid] <= value:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                bin_idx = lo - 1 - start
+                # Upper guard mirrors the fallback's
+                # cols >= len(edges) - 1 check: value == +inf walks
+                # past the +inf sentinel and must not gather
+                if bin_idx < 0 or bin_idx >= end - start - 1:
+                    t = np.nan
+                else:
+                    t += points_flat[
+                        points_offsets[num_feature_pos[q]] + bin_idx
+                    ]
+            totals[i] = t + base
+        return totals
+
+else:
+    score_batch_kernel = None
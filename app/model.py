@@ -1,82 +1,329 @@
+import copy
+import functools
+import json
+import os
 import yaml
 import re
+import numpy as np
 import pandas as pd
-import scorecardpy as sc
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, namedtuple
 from typing import Dict, Any, Optional, List, Tuple
 import threading
 
+from app import _kernels
+
+# Prefer the libyaml C loader; yaml.safe_load only uses it if requested
+# explicitly, and falls back to the ~10x slower pure-Python loader.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Interval notation like [-inf,2), [2,4), [10,inf); compiled once at
+# import instead of per bin parse.
+_INTERVAL_RE = re.compile(r"[\[\(]([^,]+),([^\]\)]+)[\]\)]")
+
+# Parsed-YAML cache keyed by path; entries hold (mtime, size, parsed dict)
+# so a reload without an on-disk change skips the parse entirely.
+_yaml_cache: "OrderedDict[str, Tuple[float, int, dict]]" = OrderedDict()
+_YAML_CACHE_MAX = 16
+
+# Bump to invalidate on-disk sidecar caches after schema changes
+_SIDECAR_CACHE_VERSION = 1
+
+
+def _read_sidecar_cache(path: str, yaml_mtime: float) -> Optional[dict]:
+    """Load the JSON sidecar written after a previous parse, if it is
+    at least as new as the YAML; JSON loads ~10x faster than YAML."""
+    cache_path = f"{path}.cache.json"
+    try:
+        if os.stat(cache_path).st_mtime < yaml_mtime:
+            return None
+        with open(cache_path, "r") as f:
+            sidecar = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if sidecar.get("cache_version") != _SIDECAR_CACHE_VERSION:
+        return None
+    return sidecar.get("config")
+
+
+def _write_sidecar_cache(path: str, parsed: dict) -> None:
+    """Atomically write the parsed config as a JSON sidecar;
+    best-effort, e.g. a read-only config directory is fine."""
+    cache_path = f"{path}.cache.json"
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {"cache_version": _SIDECAR_CACHE_VERSION, "config": parsed}, f
+            )
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError):
+        pass
+
+
+def _load_yaml_config(path: str) -> dict:
+    """Parse a YAML config, reusing the in-memory cache if the file on
+    disk is unchanged (same mtime and size) and the JSON sidecar cache
+    across cold starts."""
+    st = os.stat(path)
+    cached = _yaml_cache.get(path)
+    if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        _yaml_cache.move_to_end(path)
+        # Deep-copy: callers mutate the parsed dict downstream
+        return copy.deepcopy(cached[2])
+
+    parsed = _read_sidecar_cache(path, st.st_mtime)
+    if parsed is None:
+        with open(path, "r") as f:
+            parsed = yaml.load(f, Loader=_YamlLoader)
+        _write_sidecar_cache(path, parsed)
+
+    _yaml_cache[path] = (st.st_mtime, st.st_size, copy.deepcopy(parsed))
+    _yaml_cache.move_to_end(path)
+    while len(_yaml_cache) > _YAML_CACHE_MAX:
+        _yaml_cache.popitem(last=False)
+    return parsed
+
+
+# Immutable snapshot of everything score() needs. load_config builds a
+# fresh _State off to the side and swaps it in with a single attribute
+# assignment (atomic in CPython), so readers never observe a half-built
+# scorecard and the hot path needs no lock.
+_State = namedtuple(
+    "_State",
+    [
+        "version",
+        "score_name",
+        "scaling",
+        "base_points",
+        "bands",
+        "band_thresholds",
+        "band_names",
+        "points_lookup",
+        "numeric_bins",
+        "numeric_edges",
+        "numeric_bin_info",
+        "numeric_uniform",
+        "features",
+        "scorecard_df",
+        "scorecard_records",
+        "points_flat",
+        "points_offsets",
+        "bin_to_col",
+        "numeric_edges_np",
+        "band_thresholds_np",
+        "numeric_features",
+        "num_feature_pos",
+        "edges_flat",
+        "edges_offsets",
+    ],
+)
+
 
 class ScorecardModel:
     """
-    Loads a YAML config and converts it to a scorecardpy-compatible
-    scorecard DataFrame, then uses sc.scorecard_ply() for scoring.
+    Loads a YAML config and converts it to a bin -> points lookup
+    table for scoring, keeping a scorecardpy-compatible scorecard
+    DataFrame around for the transparency endpoint.
+
+    All derived state lives in an immutable _State snapshot; reads
+    snapshot self._state once and are safe against concurrent reloads.
     """
 
+    # Only two real attributes since the _State migration; slots make
+    # the per-access lookup a fixed offset instead of a __dict__ probe
+    __slots__ = ("config_path", "_state")
+
     def __init__(self, config_path: str = "config/scorecard.yaml"):
         self.config_path = config_path
-        self._lock = threading.Lock()
         self.load_config()
 
     def load_config(self) -> None:
-        """Load YAML and build scorecardpy-compatible scorecard DataFrame."""
-        with self._lock:
-            with open(self.config_path, "r") as f:
-                self.cfg = yaml.safe_load(f)
-
-            self.version = self.cfg.get("version", 1)
-            self.score_name = self.cfg.get("score_name", "RiskScore")
-            self.scaling = self.cfg.get("scaling", {})
-            self.bands = self.cfg.get("bands", [])
-
-            # Base points added to all scores
-            self.base_points = self.scaling.get("points0", 600)
-
-            # Build scorecardpy scorecard as dict of DataFrames per variable
-            # This is the format expected by sc.scorecard_ply()
-            self.scorecard = {}
-            self.numeric_bins = {}  # Store parsed numeric bins for pre-binning
-
-            for variable, bins in self.cfg.get("scorecard", {}).items():
-                rows = []
-                is_numeric = False
-
-                for bin_def in bins:
-                    bin_str = bin_def["bin"]
-                    rows.append({
-                        "variable": variable,
-                        "bin": bin_str,
-                        "points": bin_def["points"]
-                    })
-                    # Detect numeric bins by interval notation
-                    if "[" in bin_str or "inf" in bin_str:
-                        is_numeric = True
-
-                self.scorecard[variable] = pd.DataFrame(rows)
-
-                # Parse numeric bins for pre-binning
-                if is_numeric:
-                    self.numeric_bins[variable] = self._parse_numeric_bins(bins)
-
-            # Also keep a combined DataFrame for inspection
-            all_rows = []
-            for variable, df in self.scorecard.items():
-                all_rows.extend(df.to_dict("records"))
-            self.scorecard_df = pd.DataFrame(all_rows)
+        """Load YAML, build a new _State snapshot, and swap it in.
+
+        No instance lock: all derived state is published with one
+        atomic assignment to self._state, so concurrent readers are
+        safe, and concurrent reloaders are serialized in reload_model.
+        """
+        cfg = _load_yaml_config(self.config_path)
+
+        version = cfg.get("version", 1)
+        score_name = cfg.get("score_name", "RiskScore")
+        scaling = cfg.get("scaling", {})
+        bands = cfg.get("bands", [])
+
+        # Base points added to all scores
+        base_points = scaling.get("points0", 600)
+
+        # Sorted band thresholds for bisect lookup in _get_band
+        sorted_bands = sorted(bands, key=lambda b: b["max_score"])
+        band_thresholds = [b["max_score"] for b in sorted_bands]
+        band_names = [b["name"] for b in sorted_bands]
+
+        numeric_bins = {}  # variable -> parsed bins for pre-binning
+        points_lookup = {}  # variable -> {bin_str: points}
+        numeric_edges = {}  # variable -> sorted lower edges + [+inf]
+        numeric_bin_info = {}  # variable -> [(bin_str, points), ...]
+        numeric_uniform = {}  # variable -> (low0, width, nbins) or None
+
+        all_rows = []  # flat (variable, bin, points) tuples
+
+        for variable, bins in cfg.get("scorecard", {}).items():
+            # Convert YAML bin dicts to (bin_str, points) tuples once;
+            # everything downstream iterates tuples, not dicts
+            bin_defs = [(bd["bin"], bd["points"]) for bd in bins]
+
+            # Detect numeric bins by interval notation
+            is_numeric = any(
+                "[" in bin_str or "inf" in bin_str
+                for bin_str, _ in bin_defs
+            )
+
+            all_rows.extend(
+                (variable, bin_str, points)
+                for bin_str, points in bin_defs
+            )
+            points_lookup[variable] = dict(bin_defs)
+
+            # Parse numeric bins for pre-binning
+            if is_numeric:
+                parsed = sorted(
+                    self._parse_numeric_bins(bin_defs), key=lambda t: t[0]
+                )
+                numeric_bins[variable] = parsed
+                edges, bin_info, uniform = self._build_numeric_index(parsed)
+                numeric_edges[variable] = edges
+                numeric_bin_info[variable] = bin_info
+                numeric_uniform[variable] = uniform
+
+        # Also keep a combined DataFrame for inspection, built in
+        # one shot from the flat tuple rows
+        scorecard_df = pd.DataFrame(
+            all_rows, columns=["variable", "bin", "points"]
+        )
+        # Precomputed records for the /scorecard endpoint so it
+        # serializes a plain list instead of calling to_dict per hit
+        scorecard_records = [
+            {"variable": v, "bin": b, "points": p}
+            for v, b, p in all_rows
+        ]
+
+        # Batch-scoring tables in SoA layout: every feature's bin
+        # points concatenate into one contiguous int32 array, with
+        # offsets marking each feature's slice and per-feature
+        # bin -> index maps, so a whole batch scores as a single
+        # flat gather from one cache-friendly buffer.
+        features = list(points_lookup.keys())
+        points_offsets = np.zeros(len(features) + 1, dtype=np.intp)
+        all_points = []
+        bin_to_col = {}
+        numeric_edges_np = {}
+        for i, variable in enumerate(features):
+            if variable in numeric_bin_info:
+                # Indices follow the sorted bin order so searchsorted
+                # results map straight onto the points slice
+                feature_bins = numeric_bin_info[variable]
+                numeric_edges_np[variable] = np.asarray(
+                    numeric_edges[variable], dtype=np.float64
+                )
+            else:
+                feature_bins = list(points_lookup[variable].items())
+            all_points.extend(points for _, points in feature_bins)
+            bin_to_col[variable] = {
+                bin_str: j for j, (bin_str, _) in enumerate(feature_bins)
+            }
+            points_offsets[i + 1] = points_offsets[i] + len(feature_bins)
+        points_flat = np.asarray(all_points, dtype=np.int32)
+
+        # Flattened CSR-style edge arrays for the numba kernel
+        numeric_features = [v for v in features if v in numeric_bin_info]
+        num_feature_pos = np.asarray(
+            [features.index(v) for v in numeric_features], dtype=np.intp
+        )
+        edges_offsets = np.zeros(len(numeric_features) + 1, dtype=np.intp)
+        for q, variable in enumerate(numeric_features):
+            edges_offsets[q + 1] = (
+                edges_offsets[q] + len(numeric_edges[variable])
+            )
+        edges_flat = np.empty(edges_offsets[-1], dtype=np.float64)
+        for q, variable in enumerate(numeric_features):
+            edges_flat[edges_offsets[q]:edges_offsets[q + 1]] = (
+                numeric_edges_np[variable]
+            )
+
+        # Atomic pointer swap: readers see the old state or the new
+        # one, never a mix.
+        self._state = _State(
+            version=version,
+            score_name=score_name,
+            scaling=scaling,
+            base_points=base_points,
+            bands=bands,
+            band_thresholds=band_thresholds,
+            band_names=band_names,
+            points_lookup=points_lookup,
+            numeric_bins=numeric_bins,
+            numeric_edges=numeric_edges,
+            numeric_bin_info=numeric_bin_info,
+            numeric_uniform=numeric_uniform,
+            features=features,
+            scorecard_df=scorecard_df,
+            scorecard_records=scorecard_records,
+            points_flat=points_flat,
+            points_offsets=points_offsets,
+            bin_to_col=bin_to_col,
+            numeric_edges_np=numeric_edges_np,
+            band_thresholds_np=np.asarray(band_thresholds, dtype=np.float64),
+            numeric_features=numeric_features,
+            num_feature_pos=num_feature_pos,
+            edges_flat=edges_flat,
+            edges_offsets=edges_offsets,
+        )
+
+    @property
+    def version(self) -> int:
+        return self._state.version
+
+    @property
+    def score_name(self) -> str:
+        return self._state.score_name
+
+    @property
+    def scaling(self) -> dict:
+        return self._state.scaling
+
+    @property
+    def base_points(self) -> int:
+        return self._state.base_points
+
+    @property
+    def bands(self) -> list:
+        return self._state.bands
+
+    @property
+    def scorecard_df(self) -> pd.DataFrame:
+        return self._state.scorecard_df
+
+    @property
+    def scorecard_records(self) -> List[dict]:
+        return self._state.scorecard_records
 
     def _parse_numeric_bins(
-        self, bins: List[Dict]
+        self, bin_defs: List[Tuple[str, int]]
     ) -> List[Tuple[float, float, str, int]]:
         """
-        Parse numeric bin definitions into (low, high, bin_str, points) tuples.
+        Parse numeric (bin_str, points) tuples into
+        (low, high, bin_str, points) tuples.
         Handles interval notation like [-inf,2), [2,4), [10,inf)
         """
         parsed = []
-        for bin_def in bins:
-            bin_str = bin_def["bin"]
-            points = bin_def["points"]
-
+        for bin_str, points in bin_defs:
             # Parse interval notation: [low,high) or (low,high]
-            match = re.match(r"[\[\(]([^,]+),([^\]\)]+)[\]\)]", bin_str)
+            match = _INTERVAL_RE.match(bin_str)
             if match:
                 low_str, high_str = match.groups()
                 low = float("-inf") if "inf" in low_str else float(low_str)
@@ -85,127 +332,260 @@ class ScorecardModel:
 
         return parsed
 
+    def _build_numeric_index(
+        self, parsed: List[Tuple[float, float, str, int]]
+    ) -> Tuple[array, tuple, Optional[Tuple[float, float, int]]]:
+        """
+        Build a sorted edge array for bisect-based bin lookup.
+
+        Since bins are half-open [low, high) and non-overlapping, the
+        sorted lower edges plus a final +inf sentinel let
+        bisect_right(edges, value) - 1 find the bin directly.
+
+        Returns (edges, bin_info, uniform) where uniform is a
+        (low0, width, nbins) tuple for uniform-width bins, else None.
+        """
+        lows = [low for low, _, _, _ in parsed]
+        # array('d') packs the edges unboxed — roughly half the memory
+        # of a list of float objects and denser in cache for bisect
+        edges = array("d", lows + [float("inf")])
+        bin_info = tuple(
+            (bin_str, points) for _, _, bin_str, points in parsed
+        )
+
+        # Uniform-width bins admit a direct index computation that
+        # skips bisect entirely.
+        widths = {lows[i + 1] - lows[i] for i in range(len(lows) - 1)}
+        if (
+            len(widths) == 1
+            and all(low != float("-inf") for low in lows)
+        ):
+            uniform = (lows[0], widths.pop(), len(lows))
+        else:
+            uniform = None
+
+        return edges, bin_info, uniform
+
     def _bin_numeric_value(
-        self, variable: str, value: float
+        self, state: _State, variable: str, value: float
     ) -> Tuple[str, int]:
-        """Convert a numeric value to its bin string and points."""
-        if variable not in self.numeric_bins:
-            raise ValueError(f"No numeric bins defined for {variable}")
+        """Convert a numeric value to its bin string and points.
 
-        for low, high, bin_str, points in self.numeric_bins[variable]:
-            # Use half-open interval [low, high)
-            if low <= value < high:
-                return bin_str, points
-            # Handle the final bin which might include the upper bound
-            if high == float("inf") and value >= low:
-                return bin_str, points
+        The +inf sentinel appended to the edges removes the final-bin
+        special case, so classification is a single bisect (the scalar
+        equivalent of np.searchsorted side='right') with one guard for
+        values below the first edge; the batch path applies the same
+        searchsorted over whole columns.
+        """
+        bin_info = state.numeric_bin_info.get(variable)
+        if bin_info is None:
+            raise ValueError(f"No numeric bins defined for {variable}")
 
-        raise ValueError(
-            f"Value {value} for {variable} doesn't match any bin"
-        )
+        uniform = state.numeric_uniform[variable]
+        if uniform is not None:
+            low0, width, nbins = uniform
+            # Written as "not (>= and <)" so NaN and +inf both fail
+            # the guard rather than reaching int(), which would raise
+            # OverflowError for inf
+            if not (value >= low0 and value < float("inf")):
+                raise ValueError(
+                    f"Value {value} for {variable} doesn't match any bin"
+                )
+            # Final bin is open-ended to +inf, so clamp overshoot
+            idx = min(int((value - low0) / width), nbins - 1)
+            return bin_info[idx]
+
+        idx = bisect_right(state.numeric_edges[variable], value) - 1
+        if idx < 0 or idx >= len(bin_info):
+            raise ValueError(
+                f"Value {value} for {variable} doesn't match any bin"
+            )
+        return bin_info[idx]
 
     def score(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Score a single change record using scorecardpy.
+        Score a single change record via the precomputed points lookup.
 
-        Uses sc.scorecard_ply() which is the standard scorecardpy
-        function for applying a scorecard to new data.
+        Each feature's bin points come straight from the
+        variable -> {bin: points} table built in load_config().
 
-        Numeric features are pre-binned to match interval notation
-        before passing to scorecardpy.
+        Numeric features are pre-binned to their interval notation
+        before the lookup.
         """
-        # Pre-bin numeric features
-        binned_data = data.copy()
-        numeric_points = {}
-
-        for variable in self.numeric_bins:
-            if variable in binned_data:
-                value = binned_data[variable]
-                bin_str, points = self._bin_numeric_value(variable, value)
-                binned_data[variable] = bin_str
-                numeric_points[variable] = points
-
-        # Convert input to DataFrame (scorecardpy expects DataFrame)
-        input_df = pd.DataFrame([binned_data])
-
-        # Apply scorecard using scorecardpy's scoring function
-        # scorecard_ply returns DataFrame with score for each variable + total
-        scored_df = sc.scorecard_ply(
-            dt=input_df,
-            card=self.scorecard,
-            only_total_score=False,  # Get per-feature breakdown
-            print_step=0  # Suppress progress output
-        )
-
-        # Extract total score
-        # scorecardpy names the total column 'score'
-        total_score = float(scored_df["score"].iloc[0])
+        # Snapshot once: a concurrent reload swaps self._state wholesale
+        s = self._state
+        feature_scores = {}
+        total_score = 0.0
+
+        for variable, value in data.items():
+            if variable in s.numeric_bins:
+                # Pre-bin numeric features
+                bin_str, points = self._bin_numeric_value(s, variable, value)
+            else:
+                bin_str = value
+                points = s.points_lookup[variable][bin_str]
+            feature_scores[variable] = float(points)
+            total_score += points
 
         # Add base points to get final score
-        final_score = self.base_points + total_score
-
-        # Extract per-feature scores for explainability
-        # scorecardpy adds '_points' suffix to each variable
-        feature_scores = {}
-        for col in scored_df.columns:
-            if col.endswith("_points"):
-                feature_name = col.replace("_points", "")
-                score_val = scored_df[col].iloc[0]
-                # Use pre-computed points for numeric features if NaN
-                if pd.isna(score_val) and feature_name in numeric_points:
-                    feature_scores[feature_name] = float(numeric_points[feature_name])
-                else:
-                    feature_scores[feature_name] = float(score_val)
-
-        # Recalculate total if we had to fix NaN values
-        if numeric_points:
-            recalc_total = sum(feature_scores.values())
-            total_score = recalc_total
-            final_score = self.base_points + total_score
+        final_score = s.base_points + total_score
 
         # Determine risk band
         band = self._get_band(final_score)
 
+        # Full precision; rounding happens in the response serializer
         return {
-            "version": self.version,
-            "score": round(final_score, 2),
+            "version": s.version,
+            "score": final_score,
             "band": band,
             "feature_scores": feature_scores,
-            "raw_points": round(total_score, 2)
+            "raw_points": total_score
         }
 
+    def score_batch(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Score a batch of change records in one vectorized pass.
+
+        Builds an (N, features) index array — searchsorted for numeric
+        features, dict lookup for categoricals — then gathers points
+        from the precomputed int32 matrix and sums per row, amortizing
+        the Python-level overhead across the whole batch.
+        """
+        s = self._state
+        n = len(records)
+        n_features = len(s.features)
+        n_numeric = len(s.numeric_features)
+
+        # Categorical bin columns; numeric feature columns stay -1 and
+        # carry their raw values in num_vals instead.
+        idx = np.full((n, n_features), -1, dtype=np.intp)
+        for j, variable in enumerate(s.features):
+            if variable not in s.numeric_edges_np:
+                bin_to_col = s.bin_to_col[variable]
+                idx[:, j] = [bin_to_col[rec[variable]] for rec in records]
+
+        num_vals = np.empty((n, n_numeric), dtype=np.float64)
+        for q, variable in enumerate(s.numeric_features):
+            num_vals[:, q] = np.fromiter(
+                (rec[variable] for rec in records),
+                dtype=np.float64,
+                count=n,
+            )
+
+        if _kernels.NUMBA_AVAILABLE and n > 0:
+            scores = _kernels.score_batch_kernel(
+                idx,
+                num_vals,
+                s.num_feature_pos,
+                s.edges_flat,
+                s.edges_offsets,
+                s.points_flat,
+                s.points_offsets,
+                float(s.base_points),
+            )
+            if np.isnan(scores).any():
+                # Re-run the scalar binning to surface which value failed
+                for rec in records:
+                    for variable in s.numeric_features:
+                        self._bin_numeric_value(s, variable, rec[variable])
+                # The scalar pass must have raised; never return NaN
+                raise ValueError("batch contains an unbinnable value")
+            totals = scores - s.base_points
+        else:
+            for q, variable in enumerate(s.numeric_features):
+                edges = s.numeric_edges_np[variable]
+                cols = np.searchsorted(edges, num_vals[:, q], side="right") - 1
+                bad = (cols < 0) | (cols >= len(edges) - 1)
+                if bad.any():
+                    raise ValueError(
+                        f"Value {num_vals[:, q][bad][0]} for {variable} "
+                        f"doesn't match any bin"
+                    )
+                idx[:, s.num_feature_pos[q]] = cols
+
+            # Flat gather: per-feature bin index plus the feature's
+            # offset into the contiguous points buffer
+            totals = s.points_flat[idx + s.points_offsets[:-1]].sum(
+                axis=1, dtype=np.float64
+            )
+            scores = totals + s.base_points
+        band_idx = np.searchsorted(s.band_thresholds_np, scores, side="left")
+
+        # One vectorized rounding pass instead of two round() calls
+        # per record; the serializer rounds again but that is cheap
+        np.round(scores, 2, out=scores)
+        np.round(totals, 2, out=totals)
+
+        band_names = s.band_names
+        n_bands = len(band_names)
+        results = [
+            {
+                "score": float(scores[k]),
+                "band": band_names[band_idx[k]]
+                if band_idx[k] < n_bands
+                else "CRITICAL",
+                "raw_points": float(totals[k]),
+            }
+            for k in range(n)
+        ]
+        return {"version": s.version, "count": n, "results": results}
+
     def _get_band(self, score: float) -> str:
         """Map score to risk band."""
-        for band_def in self.bands:
-            if score <= band_def["max_score"]:
-                return band_def["name"]
+        s = self._state
+        # Bands are "score <= max_score", i.e. bisect_left over the
+        # sorted thresholds
+        i = bisect_left(s.band_thresholds, score)
+        if i < len(s.band_names):
+            return s.band_names[i]
         return "CRITICAL"
 
+    def warmup(self) -> None:
+        """
+        Score one synthetic record through the batch path so the numba
+        kernel (when available) JIT-compiles at startup rather than on
+        the first real request.
+        """
+        s = self._state
+        record = {}
+        for variable in s.features:
+            edges = s.numeric_edges_np.get(variable)
+            if edges is not None:
+                # Any value inside the first bin works
+                record[variable] = (
+                    float(edges[0]) if np.isfinite(edges[0]) else 0.0
+                )
+            else:
+                record[variable] = next(iter(s.bin_to_col[variable]))
+        self.score_batch([record])
+
     def reload(self) -> None:
         """Hot-reload configuration."""
         self.load_config()
 
     def get_features(self) -> list[str]:
         """Get list of feature names in the scorecard."""
-        return list(self.scorecard.keys())
+        return list(self._state.features)
 
 
-# Thread-safe singleton
-_model_instance: Optional[ScorecardModel] = None
-_model_lock = threading.Lock()
+@functools.cache
+def get_model() -> ScorecardModel:
+    """Get or create the singleton scorecard model.
 
+    functools.cache gives run-once semantics under the GIL without the
+    hand-rolled double-checked locking; calls after the first are a
+    plain cache hit.
+    """
+    return ScorecardModel()
 
-def get_model() -> ScorecardModel:
-    """Get or create the singleton scorecard model."""
-    global _model_instance
-    if _model_instance is None:
-        with _model_lock:
-            if _model_instance is None:
-                _model_instance = ScorecardModel()
-    return _model_instance
+
+# Serializes concurrent reloaders; scoring reads stay lock-free via
+# the atomic _state swap
+_reload_lock = threading.Lock()
 
 
 def reload_model() -> None:
     """Trigger hot-reload of the model configuration."""
     model = get_model()
-    model.reload()
+    with _reload_lock:
+        model.reload()
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 from enum import Enum
 from typing import Dict
 
@@ -161,6 +161,31 @@ class ScoreResponse(BaseModel):
         description="Raw points before base score applied"
     )
 
+    # The model returns full-precision floats; round at the JSON layer
+    @field_serializer("score", "raw_points")
+    def _round(self, value: float) -> float:
+        return round(value, 2)
+
+
+class BatchScoreItem(BaseModel):
+    """Single record result within a batch scoring response."""
+
+    score: float = Field(description="Total risk score")
+    band: str = Field(description="Risk band (LOW, MEDIUM, HIGH, CRITICAL)")
+    raw_points: float = Field(
+        description="Raw points before base score applied"
+    )
+
+
+class BatchScoreResponse(BaseModel):
+    """Response schema for batch change risk scoring."""
+
+    version: int = Field(description="Scorecard version")
+    count: int = Field(description="Number of records scored")
+    results: list[BatchScoreItem] = Field(
+        description="Per-record scores in input order"
+    )
+
 
 class HealthResponse(BaseModel):
     """Health check response."""
@@ -3,6 +3,7 @@ from app.model import get_model, reload_model
 from app.schemas import (
     ChangeInput,
     ScoreResponse,
+    BatchScoreResponse,
     HealthResponse,
     ReloadResponse,
 )
@@ -13,7 +14,7 @@ router = APIRouter()
 @router.post("/score-change", response_model=ScoreResponse)
 def score_change(input_data: ChangeInput):
     """
-    Score a change request using the scorecardpy-based model.
+    Score a change request using the scorecard model.
 
     Returns explainable score with per-feature breakdown.
 
@@ -25,7 +26,10 @@ def score_change(input_data: ChangeInput):
     """
     try:
         model = get_model()
-        result = model.score(input_data.model_dump())
+        # __dict__ already holds plain values (use_enum_values=True
+        # stores enum members as strings at validation), so skip the
+        # model_dump() traversal on the hot path
+        result = model.score(input_data.__dict__)
         return result
     except KeyError as e:
         raise HTTPException(
@@ -36,6 +40,27 @@ def score_change(input_data: ChangeInput):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/score-changes", response_model=BatchScoreResponse)
+def score_changes(input_data: list[ChangeInput]):
+    """
+    Score a batch of change requests in one vectorized pass.
+
+    Accepts a list of change records and returns scores and risk bands
+    in input order. Much faster than calling /score-change per record
+    since the scoring is done with NumPy across the whole batch.
+    """
+    try:
+        model = get_model()
+        return model.score_batch([item.__dict__ for item in input_data])
+    except KeyError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid value for feature: {e}"
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/reload-config", response_model=ReloadResponse)
 def reload_config():
     """
@@ -80,6 +105,6 @@ def get_scorecard():
     return {
         "version": model.version,
         "base_points": model.base_points,
-        "scorecard": model.scorecard_df.to_dict(orient="records"),
+        "scorecard": model.scorecard_records,
         "bands": model.bands
     }
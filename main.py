@@ -1,10 +1,12 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from app.service import router as scoring_router
 
 app = FastAPI(
     title="Change Risk Scorecard Service",
-    description="Risk scoring service using scorecardpy for change management",
+    description="Scorecard-based risk scoring service for change management",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(scoring_router, tags=["scoring"])
@@ -15,6 +17,7 @@ async def startup():
     """Validate scorecard loads correctly on startup."""
     from app.model import get_model
     model = get_model()
+    model.warmup()  # trigger numba JIT compilation before first request
     print(f"Loaded scorecard v{model.version} with {len(model.scorecard_df)} bins")
     print(f"Features: {model.get_features()}")
 
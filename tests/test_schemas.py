@@ -0,0 +1,48 @@
+from app.schemas import ChangeInput
+
+VALID_INPUT = {
+    "data_sensitivity": "payment_card_data",
+    "downtime_impact": "major_disruption",
+    "integrity_impact": "financial_harm",
+    "breach_consequence": "pii_breach",
+    "disaster_recovery": "four_hours",
+    "system_dependencies": "high_dependency",
+    "regulatory_count": 3,
+    "resilience_category": "1",
+    "change_size": "M",
+    "test_depth": "UNIT_ONLY",
+    "apps_sharing_codebase": 2,
+    "downstream_critical_deps": 1,
+}
+
+# Enum-typed fields on ChangeInput
+ENUM_FIELDS = [
+    "data_sensitivity",
+    "downtime_impact",
+    "integrity_impact",
+    "breach_consequence",
+    "disaster_recovery",
+    "system_dependencies",
+    "resilience_category",
+    "change_size",
+    "test_depth",
+]
+
+
+def test_enum_fields_stored_as_strings():
+    """use_enum_values=True must store enum members as plain strings.
+
+    The scoring endpoints read input via __dict__, so the bin lookup
+    depends on validated values being str, not Enum members.
+    """
+    model = ChangeInput(**VALID_INPUT)
+    for field in ENUM_FIELDS:
+        value = getattr(model, field)
+        assert type(value) is str, f"{field} stored as {type(value)}"
+
+
+def test_dict_matches_model_dump():
+    """__dict__ is used in place of model_dump() on the hot path; the
+    two must stay interchangeable across pydantic upgrades."""
+    model = ChangeInput(**VALID_INPUT)
+    assert model.__dict__ == model.model_dump()